@@ -31,10 +31,13 @@ Special combos:
     Home (held 5s):             recalibrate accelerometer zero-point
 """
 
+import concurrent.futures
 import logging
 import os
+import select
 import signal
 import struct
+import subprocess
 import sys
 import threading
 import time
@@ -69,12 +72,31 @@ _slot_connected = {}       # {slot_index: bool} — True if slot has a Wiimote
 _slot_connected_lock = threading.Lock()
 POLL_RATE_HZ = 100
 POLL_INTERVAL = 1.0 / POLL_RATE_HZ
+REPORT_HEARTBEAT_INTERVAL = 1.0  # seconds; resend an unchanged report this often
+REPORT_HEARTBEAT_FRAMES = int(REPORT_HEARTBEAT_INTERVAL * POLL_RATE_HZ)
 SCAN_RETRY_DELAY = 2.0  # seconds between scan attempts
 HIDG_WAIT_INTERVAL = 3.0  # seconds between checks for /dev/hidg* availability
+HIDG_EXISTS_CACHE_TTL = 1.0  # seconds to reuse a /dev/hidg* existence check
+HIDG_RELEASE_TIMEOUT = 0.1  # seconds to wait for the host to take a release report
 CONNECT_RUMBLE_DURATION = 0.3  # seconds of rumble on connect
 DISCONNECT_RUMBLE_DURATION = 0.5  # seconds of rumble on manual disconnect
 DISCONNECT_HOLD_TIME = 5.0  # seconds to hold +/- combo to disconnect
 RECALIBRATE_HOLD_TIME = 5.0  # seconds to hold Home to recalibrate
+RECALIBRATE_SAMPLES = 20  # frames averaged for the new zero-point (~200 ms)
+SLOT_RT_PRIORITY = 20  # SCHED_FIFO priority for slot threads (needs root)
+BT_ADAPTER_PATH = "/org/bluez/hci0"  # BlueZ D-Bus object of the adapter
+BT_PAIRABLE_ATTEMPTS = 3  # tries while bluetoothd may still be starting
+BT_PAIRABLE_RETRY_DELAY = 1.0  # seconds between those tries
+BT_PAIRABLE_TIMEOUT = 5.0  # seconds before a single busctl call is abandoned
+
+# Special-combo buttons, frozen into plain module ints so the per-frame
+# checks skip the cwiid module attribute lookup
+_BTN_HOME = cwiid.BTN_HOME
+_DISCONNECT_COMBO = cwiid.BTN_PLUS | cwiid.BTN_MINUS
+
+# Exceptions the cwiid binding raises: RuntimeError for Bluetooth I/O
+# failures, ValueError for calls on an already-closed Wiimote
+CWIID_ERRORS = (RuntimeError, ValueError)
 
 # LED bitmasks for player numbers (cwiid LED constants)
 PLAYER_LEDS = [
@@ -108,31 +130,32 @@ logger = logging.getLogger("wiimote-bridge")
 
 # The 4-byte struct: signed byte (X), signed byte (Y), hat switch, buttons
 REPORT_FORMAT = "<bbBB"
-ZERO_REPORT = struct.pack(REPORT_FORMAT, 0, 0, 8, 0)  # hat=8 means no direction
+_REPORT_STRUCT = struct.Struct(REPORT_FORMAT)  # format parsed once
+ZERO_REPORT = _REPORT_STRUCT.pack(0, 0, 8, 0)  # hat=8 means no direction
 
 
-def clamp(value, minimum, maximum):
-    """Clamp a value to the given range."""
-    if value < minimum:
-        return minimum
-    if value > maximum:
-        return maximum
-    return value
-
-
-def acc_to_axis(raw, zero, sensitivity=ACC_SENSITIVITY):
-    """Convert a raw accelerometer value to a signed axis byte (-127..127).
+def acc_to_axes(raw_x, raw_y, zero_x, zero_y, sensitivity=ACC_SENSITIVITY):
+    """Convert raw X/Y accelerometer values to signed axis bytes (-127..127).
 
     Args:
-        raw: Raw accelerometer reading (0-255 range).
-        zero: Calibrated zero-point (value at rest).
+        raw_x, raw_y: Raw accelerometer readings (0-255 range).
+        zero_x, zero_y: Calibrated zero-points (values at rest).
         sensitivity: Multiplier for the raw offset.
 
     Returns:
-        Integer in range -127..127.
+        Tuple (x_axis, y_axis), each in range -127..127.
     """
-    offset = (raw - zero) * sensitivity
-    return clamp(int(offset), -127, 127)
+    x_axis = int((raw_x - zero_x) * sensitivity)
+    y_axis = int((raw_y - zero_y) * sensitivity)
+    if x_axis < -127:
+        x_axis = -127
+    elif x_axis > 127:
+        x_axis = 127
+    if y_axis < -127:
+        y_axis = -127
+    elif y_axis > 127:
+        y_axis = 127
+    return x_axis, y_axis
 
 
 # Mapping table: (cwiid button constant, HID button bit)
@@ -148,21 +171,42 @@ _BUTTON_MAP = (
 )
 
 
+def _bit_of(mask):
+    """Return the bit position of a single-bit mask."""
+    return mask.bit_length() - 1
+
+
+# Bit positions of each mapped cwiid button, resolved once at import
+_SHIFT_A = _bit_of(cwiid.BTN_A)
+_SHIFT_B = _bit_of(cwiid.BTN_B)
+_SHIFT_1 = _bit_of(cwiid.BTN_1)
+_SHIFT_2 = _bit_of(cwiid.BTN_2)
+_SHIFT_PLUS = _bit_of(cwiid.BTN_PLUS)
+_SHIFT_MINUS = _bit_of(cwiid.BTN_MINUS)
+_SHIFT_HOME = _bit_of(cwiid.BTN_HOME)
+
+
 def encode_buttons(cwiid_buttons):
     """Convert cwiid button bitmask to our 8-bit HID button byte.
 
-    Iterates over the mapping table and sets the corresponding HID bit
-    for each pressed Wiimote button.
+    Branchless bit permutation: each cwiid bit is shifted down to bit 0,
+    masked, and shifted up to its HID position (same layout as
+    _BUTTON_MAP). No loop and no lookup table.
     """
-    hid_buttons = 0
-    for cwiid_btn, hid_bit in _BUTTON_MAP:
-        if cwiid_buttons & cwiid_btn:
-            hid_buttons |= hid_bit
-    return hid_buttons
+    b = cwiid_buttons
+    return (
+        ((b >> _SHIFT_A) & 1)
+        | (((b >> _SHIFT_B) & 1) << 1)
+        | (((b >> _SHIFT_1) & 1) << 2)
+        | (((b >> _SHIFT_2) & 1) << 3)
+        | (((b >> _SHIFT_PLUS) & 1) << 4)
+        | (((b >> _SHIFT_MINUS) & 1) << 5)
+        | (((b >> _SHIFT_HOME) & 1) << 6)
+    )
 
 
-def encode_hat_switch(cwiid_buttons):
-    """Convert D-pad button state to HID hat switch value.
+def _compute_hat_switch(cwiid_buttons):
+    """Reference D-pad → hat switch mapping, used to fill _HAT_LUT.
 
     Hat switch values (clockwise from north):
         0=Up, 1=Up-Right, 2=Right, 3=Down-Right,
@@ -193,9 +237,60 @@ def encode_hat_switch(cwiid_buttons):
     return 8  # null — no direction
 
 
-def build_report(x_axis, y_axis, hat_switch, buttons_byte):
-    """Pack a 4-byte HID gamepad report."""
-    return struct.pack(REPORT_FORMAT, x_axis, y_axis, hat_switch, buttons_byte)
+_DPAD_BUTTONS = (cwiid.BTN_UP, cwiid.BTN_DOWN, cwiid.BTN_LEFT, cwiid.BTN_RIGHT)
+_DPAD_MASK = cwiid.BTN_UP | cwiid.BTN_DOWN | cwiid.BTN_LEFT | cwiid.BTN_RIGHT
+
+
+def _build_hat_lut():
+    """Precompute the hat value for all 16 D-pad combinations.
+
+    Keyed by `cwiid_buttons & _DPAD_MASK`.
+    """
+    lut = {}
+    for combo in range(1 << len(_DPAD_BUTTONS)):
+        key = 0
+        for i, btn in enumerate(_DPAD_BUTTONS):
+            if combo & (1 << i):
+                key |= btn
+        lut[key] = _compute_hat_switch(key)
+    return lut
+
+
+_HAT_LUT = _build_hat_lut()
+
+
+def encode_hat_switch(cwiid_buttons):
+    """Convert D-pad button state to HID hat switch value.
+
+    A single lookup into _HAT_LUT; see _compute_hat_switch for the
+    mapping itself.
+    """
+    return _HAT_LUT[cwiid_buttons & _DPAD_MASK]
+
+
+# Every cwiid button the bridge reacts to (11 bits → 2048 combinations)
+_INPUT_BUTTONS = _DPAD_BUTTONS + tuple(cwiid_btn for cwiid_btn, _ in _BUTTON_MAP)
+_INPUT_MASK = sum(_INPUT_BUTTONS)  # distinct single bits
+_SPECIAL_MASK = _DISCONNECT_COMBO | _BTN_HOME
+
+
+def _build_input_lut():
+    """Precompute (hid_buttons, hat, special) for every input combination.
+
+    Keyed by `cwiid_buttons & _INPUT_MASK`. `special` is the subset of
+    combo buttons (+, -, Home) pressed, so the forward loop can skip
+    the hold-combo logic entirely when it is zero.
+    """
+    keys = [0]
+    for btn in _INPUT_BUTTONS:
+        keys += [key | btn for key in keys]
+    return {
+        key: (encode_buttons(key), encode_hat_switch(key), key & _SPECIAL_MASK)
+        for key in keys
+    }
+
+
+_INPUT_LUT = _build_input_lut()
 
 
 # ---------------------------------------------------------------------------
@@ -215,6 +310,7 @@ class HIDWriter:
         self.device_path = device_path
         self._fd = None
         self._reopen_at = 0.0  # earliest time we may retry opening
+        self._avail_cached = (0.0, False)  # (monotonic check time, result)
 
     @property
     def is_open(self):
@@ -222,8 +318,18 @@ class HIDWriter:
         return self._fd is not None
 
     def is_available(self):
-        """Check if the HID gadget device file exists on disk."""
-        return os.path.exists(self.device_path)
+        """Check if the HID gadget device file exists on disk.
+
+        The result is cached for HIDG_EXISTS_CACHE_TTL so that a slot
+        polling with USB unplugged doesn't stat() the path every frame.
+        """
+        now = time.monotonic()
+        checked_at, available = self._avail_cached
+        if now - checked_at < HIDG_EXISTS_CACHE_TTL:
+            return available
+        available = os.path.exists(self.device_path)
+        self._avail_cached = (now, available)
+        return available
 
     def try_open(self):
         """Try to open the HID gadget device. Returns True on success.
@@ -239,7 +345,10 @@ class HIDWriter:
         if not self.is_available():
             return False
         try:
-            self._fd = open(self.device_path, "wb+", buffering=0)
+            # Raw fd rather than a FileIO wrapper: each report is a single
+            # os.write() with no Python-level file object in between.
+            # Non-blocking so a slow gadget host can't stall the poll thread.
+            self._fd = os.open(self.device_path, os.O_WRONLY | os.O_NONBLOCK)
             logger.info("Opened HID device: %s", self.device_path)
             return True
         except OSError as exc:
@@ -248,38 +357,144 @@ class HIDWriter:
             return False
 
     def write(self, report):
-        """Write a raw HID report (bytes) to the device.
+        """Write a raw HID report (any bytes-like object) to the device.
 
-        Silently drops the report if the device isn't open.
-        Closes the device on write failure (e.g. USB cable unplugged)
-        and sets a cooldown before retrying to avoid rapid retry loops.
+        Silently drops the report if the device isn't open, or if the
+        host hasn't consumed the previous report yet (the next poll
+        supplies a fresh one). Closes the device on write failure (e.g.
+        USB cable unplugged) and sets a cooldown before retrying to
+        avoid rapid retry loops.
+
+        Returns:
+            True if the report was written, False otherwise.
         """
         if self._fd is None:
-            return
+            return False
         try:
-            self._fd.write(report)
+            os.write(self._fd, report)
+            return True
+        except BlockingIOError:
+            return False
         except OSError as exc:
             logger.warning("Write to %s failed (USB disconnected?): %s", self.device_path, exc)
-            self.close()
+            self.close(send_release=False)
             self._reopen_at = time.time() + HIDG_WAIT_INTERVAL
+            return False
 
     def release_all(self):
-        """Send a zero report (all buttons released, axes centered)."""
-        self.write(ZERO_REPORT)
+        """Send a zero report (all buttons released, axes centered).
 
-    def close(self):
-        """Send a release report and close the device."""
+        Unlike write(), this doesn't give up when the host hasn't polled
+        the previous report yet: it waits (up to HIDG_RELEASE_TIMEOUT)
+        for the endpoint to become writable, so the release can't be
+        silently dropped right before the device is closed.
+        """
+        deadline = time.monotonic() + HIDG_RELEASE_TIMEOUT
+        while True:
+            fd = self._fd
+            if fd is None or self.write(ZERO_REPORT):
+                return
+            if self._fd is None:
+                return  # hard write failure; write() already closed it
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Release report to %s timed out", self.device_path)
+                return
+            try:
+                select.select([], [fd], [], remaining)
+            except (OSError, ValueError):
+                return  # fd closed underneath us
+
+    def close(self, send_release=True):
+        """Close the device, first sending a release report by default.
+
+        Pass send_release=False when release_all() was just called, so
+        the host doesn't get the same zero report twice.
+        """
+        if send_release:
+            self.release_all()
         if self._fd is not None:
             try:
-                self._fd.write(ZERO_REPORT)
+                os.close(self._fd)
             except OSError:
                 pass
+            self._fd = None
+            self._avail_cached = (0.0, False)
+            logger.info("Closed HID device: %s", self.device_path)
+
+
+# ---------------------------------------------------------------------------
+# Poll timer — fixed-rate tick source for the forward loop
+# ---------------------------------------------------------------------------
+
+class PollTimer:
+    """Paces a loop at a fixed interval without accumulating drift.
+
+    Uses a periodic timerfd where the interpreter exposes one (Python
+    3.13+), so each tick is a single read(2) that the kernel releases on
+    a stable cadence. On older interpreters it falls back to sleeping
+    until an absolute monotonic deadline. Either way the time spent
+    polling and writing is absorbed into the interval instead of being
+    added on top of it.
+
+    Ticks fall on a grid of the monotonic clock, offset by `phase`
+    seconds, so timers sharing an interval but given different phases
+    wake at staggered instants instead of all at once.
+    """
+
+    def __init__(self, interval, stop_event=None, phase=0.0):
+        self.interval = interval
+        self._stop_event = stop_event  # cuts the fallback sleep short
+        self._tfd = None
+        now = time.monotonic()
+        self._next_tick = (now // interval + 1) * interval + phase
+        if hasattr(os, "timerfd_create"):
+            try:
+                self._tfd = os.timerfd_create(
+                    time.CLOCK_MONOTONIC, flags=os.TFD_CLOEXEC
+                )
+                os.timerfd_settime(
+                    self._tfd,
+                    flags=os.TFD_TIMER_ABSTIME,
+                    initial=self._next_tick,
+                    interval=interval,
+                )
+            except OSError as exc:
+                logger.debug("timerfd unavailable, using sleep: %s", exc)
+                self.close()
+
+    def wait(self):
+        """Block until the next tick."""
+        tfd = self._tfd
+        if tfd is not None:
             try:
-                self._fd.close()
+                # Returns the number of expirations; missed ticks coalesce
+                os.read(tfd, 8)
+                return
+            except OSError:
+                pass  # closed by another thread during shutdown
+        now = time.monotonic()
+        delay = self._next_tick - now
+        if delay > 0:
+            if self._stop_event is not None:
+                self._stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+        elif delay < -self.interval:
+            # More than a tick behind (GC pause, scan lock, ...): skip the
+            # missed ticks instead of bursting through them back to back,
+            # staying on the same phase grid.
+            self._next_tick += (-delay // self.interval) * self.interval
+        self._next_tick += self.interval
+
+    def close(self):
+        """Release the timerfd, if one was created."""
+        if self._tfd is not None:
+            try:
+                os.close(self._tfd)
             except OSError:
                 pass
-            self._fd = None
-            logger.info("Closed HID device: %s", self.device_path)
+            self._tfd = None
 
 
 # ---------------------------------------------------------------------------
@@ -309,9 +524,16 @@ class PlayerSlot:
 
         self._wiimote = None
         self._thread = None
-        self._running = False
+        self._stop = threading.Event()  # set when the slot should exit
         self._acc_zero = DEFAULT_ACC_ZERO
         self._usb_was_connected = False
+        self._timer = None
+        self._rumble_off_at = None  # monotonic deadline of the current rumble pulse
+        # Reused for every report so the forward loop doesn't allocate
+        self._report_buf = bytearray(_REPORT_STRUCT.size)
+        # Last report actually written, for skipping unchanged frames
+        self._last_report = bytearray(_REPORT_STRUCT.size)
+        self._frames_since_write = 0
 
         # Track hold durations for special combos
         self._disconnect_held_since = None  # time when +/- combo first held
@@ -319,18 +541,19 @@ class PlayerSlot:
 
     def start(self):
         """Start the player slot thread (scan + forward loop)."""
-        self._running = True
+        self._stop.clear()
         self._thread = threading.Thread(
             target=self._run,
             name=f"player-{self.player_num}",
             daemon=True,
         )
         self._thread.start()
+        self._pin_thread_to_cpu()
         logger.info("[%s] Slot started, scanning for Wiimote...", self.player_label)
 
     def stop(self):
         """Signal the player slot thread to stop."""
-        self._running = False
+        self._stop.set()
         self._disconnect()
 
     def join(self, timeout=5):
@@ -340,9 +563,54 @@ class PlayerSlot:
 
     # --- internal ---
 
+    def _pin_thread_to_cpu(self):
+        """Bind the slot thread to one core so it doesn't migrate.
+
+        Slots are spread round-robin over the CPUs the daemon may use.
+        A no-op on single-core boards (Pi Zero W) and on platforms
+        without sched_setaffinity.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) < 2:
+            return
+        cpu = cpus[self.player_num % len(cpus)]
+        try:
+            os.sched_setaffinity(self._thread.native_id, {cpu})
+            logger.debug("[%s] Slot thread pinned to CPU %d", self.player_label, cpu)
+        except OSError as exc:
+            logger.debug("[%s] Cannot pin slot thread: %s", self.player_label, exc)
+
+    def _set_realtime_priority(self, enabled):
+        """Switch the calling slot thread to SCHED_FIFO, or back to SCHED_OTHER.
+
+        Only the forward loop runs real-time: it keeps the 10 ms tick
+        from being preempted by ordinary userspace work (e.g. bluetoothd,
+        kswapd bursts), which is what shows up as latency spikes on the
+        host. Scanning stays at normal priority, so the libcwiid threads
+        created by cwiid.Wiimote() don't inherit the real-time policy.
+        Falls back to normal scheduling with a warning if the daemon
+        lacks the privilege.
+        """
+        if not hasattr(os, "sched_setscheduler"):
+            return
+        if enabled:
+            policy, priority = os.SCHED_FIFO, SLOT_RT_PRIORITY
+        else:
+            policy, priority = os.SCHED_OTHER, 0
+        try:
+            os.sched_setscheduler(0, policy, os.sched_param(priority))
+        except OSError as exc:
+            logger.warning(
+                "[%s] Cannot change scheduling policy, using normal scheduling: %s",
+                self.player_label,
+                exc,
+            )
+
     def _run(self):
         """Main loop: scan for Wiimote, forward inputs, handle disconnect."""
-        while self._running:
+        while not self._stop.is_set():
             # Mark this slot as disconnected
             with _slot_connected_lock:
                 _slot_connected[self.player_num] = False
@@ -350,7 +618,7 @@ class PlayerSlot:
             # Phase 1: scan and connect
             wiimote = self._scan_for_wiimote()
             if wiimote is None:
-                continue  # _running was set to False, or scan error
+                continue  # slot was stopped, or scan error
 
             self._wiimote = wiimote
 
@@ -370,11 +638,15 @@ class PlayerSlot:
 
             # Phase 3: forward inputs (handles USB not being ready yet)
             logger.info("[%s] Wiimote ready, forwarding inputs", self.player_label)
-            self._forward_loop(wiimote)
+            self._set_realtime_priority(True)
+            try:
+                self._forward_loop(wiimote)
+            finally:
+                self._set_realtime_priority(False)
 
             # Phase 4: cleanup after disconnect
             self._disconnect()
-            if self._running:
+            if not self._stop.is_set():
                 logger.info("[%s] Wiimote disconnected, rescanning...", self.player_label)
 
     def _is_my_turn_to_scan(self):
@@ -399,10 +671,10 @@ class PlayerSlot:
         Returns:
             A cwiid.Wiimote instance, or None if stopped / error.
         """
-        while self._running:
+        while not self._stop.is_set():
             # Wait for our turn — only scan if all lower slots are connected
             if not self._is_my_turn_to_scan():
-                time.sleep(SCAN_RETRY_DELAY)
+                self._stop.wait(SCAN_RETRY_DELAY)
                 continue
 
             logger.info(
@@ -422,7 +694,7 @@ class PlayerSlot:
                 logger.debug("[%s] No Wiimote found, retrying...", self.player_label)
             finally:
                 _bt_scan_lock.release()
-            time.sleep(SCAN_RETRY_DELAY)
+            self._stop.wait(SCAN_RETRY_DELAY)
         return None
 
     def _configure_wiimote(self, wiimote):
@@ -433,14 +705,29 @@ class PlayerSlot:
         # Enable button + accelerometer reporting
         wiimote.rpt_mode = cwiid.RPT_BTN | cwiid.RPT_ACC
 
-        # Brief rumble to confirm connection
-        wiimote.rumble = True
-        time.sleep(CONNECT_RUMBLE_DURATION)
-        wiimote.rumble = False
+        # Brief rumble to confirm connection (doesn't delay the first report)
+        self._pulse_rumble(wiimote, CONNECT_RUMBLE_DURATION)
 
         # Calibrate accelerometer zero-point
         self._calibrate_accelerometer(wiimote)
 
+    def _pulse_rumble(self, wiimote, duration):
+        """Rumble for `duration` seconds without blocking the slot thread.
+
+        Only records a deadline; the forward loop switches the rumble
+        off once it passes, so polling carries on during the pulse.
+        """
+        wiimote.rumble = True
+        self._rumble_off_at = time.monotonic() + duration
+
+    def _end_rumble(self, wiimote):
+        """Stop the current rumble pulse (the Wiimote may already be gone)."""
+        self._rumble_off_at = None
+        try:
+            wiimote.rumble = False
+        except CWIID_ERRORS:
+            pass
+
     def _calibrate_accelerometer(self, wiimote):
         """Read the accelerometer calibration zero-point from the Wiimote."""
         try:
@@ -452,13 +739,35 @@ class PlayerSlot:
                 self.player_label,
                 *self._acc_zero,
             )
-        except Exception:
+        except CWIID_ERRORS:
             self._acc_zero = DEFAULT_ACC_ZERO
             logger.warning(
                 "[%s] Accelerometer calibration failed, using defaults",
                 self.player_label,
             )
 
+    def _apply_rest_calibration(self, samples):
+        """Set the X/Y zero-point to the mean of the sampled readings.
+
+        Used for Home-hold recalibration: whatever pose the Wiimote is
+        held in becomes the centered stick position. Z keeps its
+        previous zero since it isn't mapped to an axis.
+
+        Returns:
+            The new (zero_x, zero_y).
+        """
+        count = len(samples)
+        zero_x = round(sum(acc[0] for acc in samples) / count)
+        zero_y = round(sum(acc[1] for acc in samples) / count)
+        self._acc_zero = (zero_x, zero_y, self._acc_zero[2])
+        logger.info(
+            "[%s] Accelerometer recalibrated: zero=(%d, %d, %d) from %d samples",
+            self.player_label,
+            *self._acc_zero,
+            count,
+        )
+        return zero_x, zero_y
+
     def _forward_loop(self, wiimote):
         """Poll the Wiimote state and write HID reports at POLL_RATE_HZ.
 
@@ -470,31 +779,73 @@ class PlayerSlot:
         """
         self._disconnect_held_since = None
         self._home_held_since = None
-
-        while self._running:
+        # Stagger slots across the tick so they don't all wake together
+        phase = POLL_INTERVAL * self.player_num / NUM_PLAYERS
+        timer = self._timer = PollTimer(POLL_INTERVAL, self._stop, phase)
+
+        # Hoist loop-invariant lookups into locals for the 100 Hz loop
+        acc_zero_x, acc_zero_y = self._acc_zero[0], self._acc_zero[1]
+        pack_report_into = _REPORT_STRUCT.pack_into
+        report = self._report_buf
+        send_report = self._send_report
+        cal_samples = None  # accelerometer readings while recalibrating
+        combo_pending = 0  # special buttons seen last frame
+
+        while not self._stop.is_set():
             try:
                 state = wiimote.state
-            except Exception:
+            except CWIID_ERRORS:
                 # Wiimote disconnected or communication error
                 logger.warning("[%s] Lost connection to Wiimote", self.player_label)
                 break
 
-            buttons = state.get("buttons", 0)
-
-            # Check for held special combos (triggers after hold duration)
-            action = self._handle_special_combos(wiimote, buttons)
-            if action == "disconnect":
-                break
+            # cwiid includes a state key for every enabled report type, and
+            # _configure_wiimote enables RPT_BTN | RPT_ACC, so both keys
+            # are always present: plain subscripts, each read once.
+            buttons = state["buttons"]
+            acc = state["acc"]
+
+            # Buttons byte, hat and combo buttons in a single lookup
+            hid_buttons, hat, special = _INPUT_LUT[buttons & _INPUT_MASK]
+
+            # Check for held special combos (triggers after hold duration).
+            # Skipped while no combo button is down; one extra call after
+            # release lets _handle_special_combos reset its hold timers.
+            if special or combo_pending:
+                combo_pending = special
+                action = self._handle_special_combos(wiimote, buttons)
+                if action == "disconnect":
+                    break
+                if action == "recalibrate":
+                    cal_samples = []
             # Note: recalibrate doesn't skip the report — buttons
             # (including Home) are still sent while holding.
 
-            # Build HID report from Wiimote state
-            report = self._build_report_from_state(state, buttons)
+            # Recalibration samples ride along with normal polling
+            if cal_samples is not None:
+                cal_samples.append(acc)
+                if len(cal_samples) >= RECALIBRATE_SAMPLES:
+                    acc_zero_x, acc_zero_y = self._apply_rest_calibration(cal_samples)
+                    cal_samples = None
+
+            # Build HID report from Wiimote state, in place
+            x_axis, y_axis = acc_to_axes(acc[0], acc[1], acc_zero_x, acc_zero_y)
+            pack_report_into(
+                report,
+                0,
+                x_axis,
+                y_axis,
+                hat,
+                hid_buttons,
+            )
 
             # Try to send via USB HID — resilient to USB not being connected
-            self._send_report(report)
+            send_report(report)
+
+            if self._rumble_off_at is not None and time.monotonic() >= self._rumble_off_at:
+                self._end_rumble(wiimote)
 
-            time.sleep(POLL_INTERVAL)
+            timer.wait()
 
     def _handle_special_combos(self, wiimote, buttons):
         """Check for held special combos. Returns action string or None.
@@ -505,23 +856,21 @@ class PlayerSlot:
         now = time.time()
 
         # Disconnect combo: + and - held together for DISCONNECT_HOLD_TIME
-        if (buttons & cwiid.BTN_PLUS) and (buttons & cwiid.BTN_MINUS):
+        if buttons & _DISCONNECT_COMBO == _DISCONNECT_COMBO:
             if self._disconnect_held_since is None:
                 self._disconnect_held_since = now
             elif now - self._disconnect_held_since >= DISCONNECT_HOLD_TIME:
                 logger.info("[%s] Disconnect combo held (+/-)", self.player_label)
                 try:
-                    wiimote.rumble = True
-                    time.sleep(DISCONNECT_RUMBLE_DURATION)
-                    wiimote.rumble = False
-                except Exception:
+                    self._pulse_rumble(wiimote, DISCONNECT_RUMBLE_DURATION)
+                except CWIID_ERRORS:
                     pass
                 return "disconnect"
         else:
             self._disconnect_held_since = None
 
         # Recalibrate: Home held for RECALIBRATE_HOLD_TIME
-        if buttons & cwiid.BTN_HOME:
+        if buttons & _BTN_HOME:
             if self._home_held_since is None:
                 self._home_held_since = now
             elif now - self._home_held_since >= RECALIBRATE_HOLD_TIME:
@@ -529,34 +878,41 @@ class PlayerSlot:
                     "[%s] Recalibrating accelerometer (Home held)",
                     self.player_label,
                 )
-                self._calibrate_accelerometer(wiimote)
                 self._home_held_since = None  # reset so it doesn't re-trigger
+                return "recalibrate"
         else:
             self._home_held_since = None
 
         return None
 
-    def _build_report_from_state(self, state, buttons):
-        """Extract accelerometer + buttons from Wiimote state into an HID report."""
-        acc = state.get("acc", DEFAULT_ACC_ZERO)
-        x_axis = acc_to_axis(acc[0], self._acc_zero[0])
-        y_axis = acc_to_axis(acc[1], self._acc_zero[1])
-        hat = encode_hat_switch(buttons)
-        hid_buttons = encode_buttons(buttons)
-        return build_report(x_axis, y_axis, hat, hid_buttons)
-
     def _send_report(self, report):
-        """Send an HID report, handling USB connect/disconnect transitions."""
-        if not self.hid.is_open:
-            if self.hid.try_open():
-                self._log_usb_state(connected=True)
-                self._usb_was_connected = True
-        if self.hid.is_open:
-            self.hid.write(report)
-            # If write failed, HIDWriter closes itself; detect on next call
-            if not self.hid.is_open and self._usb_was_connected:
-                self._log_usb_state(connected=False)
-                self._usb_was_connected = False
+        """Send an HID report, handling USB connect/disconnect transitions.
+
+        Reports identical to the last one written are skipped (the gadget
+        host keeps the previous state), except for a heartbeat resend
+        every REPORT_HEARTBEAT_FRAMES frames. The first report after the
+        device is (re)opened is always written.
+        """
+        hid = self.hid
+        if not hid.is_open:
+            if not hid.try_open():
+                return
+            self._log_usb_state(connected=True)
+            self._usb_was_connected = True
+        elif (
+            report == self._last_report
+            and self._frames_since_write < REPORT_HEARTBEAT_FRAMES
+        ):
+            self._frames_since_write += 1
+            return
+        if hid.write(report):
+            self._last_report[:] = report
+            self._frames_since_write = 0
+        # On a failed write HIDWriter closes itself; a dropped report
+        # (host busy) leaves it open and is simply retried next frame
+        elif not hid.is_open and self._usb_was_connected:
+            self._log_usb_state(connected=False)
+            self._usb_was_connected = False
 
     def _log_usb_state(self, connected):
         """Log USB HID connection state changes (avoids log spam)."""
@@ -568,14 +924,27 @@ class PlayerSlot:
     def _disconnect(self):
         """Clean up Wiimote connection and HID device."""
         self.hid.release_all()
-        self.hid.close()
+        self.hid.close(send_release=False)
+
+        if self._timer is not None:
+            self._timer.close()
+            self._timer = None
+
+        # HID is already released above; let a pending pulse (e.g. the
+        # disconnect-combo feedback) finish before closing the Wiimote.
+        # The wait returns at once if the whole bridge is shutting down.
+        if self._rumble_off_at is not None:
+            remaining = self._rumble_off_at - time.monotonic()
+            if remaining > 0:
+                self._stop.wait(remaining)
+            self._rumble_off_at = None
 
         if self._wiimote is not None:
             try:
                 self._wiimote.rumble = False
                 self._wiimote.led = 0
                 self._wiimote.close()
-            except Exception:
+            except CWIID_ERRORS:
                 pass
             self._wiimote = None
 
@@ -610,12 +979,14 @@ class WiimoteBridge:
                     hidg,
                 )
 
-        # Ensure adapter is pairable for classic Bluetooth (Wiimotes)
-        try:
-            os.system("bluetoothctl pairable on 2>/dev/null")
-            logger.info("Bluetooth adapter set to pairable")
-        except Exception:
-            pass
+        # Ensure adapter is pairable for classic Bluetooth (Wiimotes).
+        # Runs in the background so a slow bluetoothd doesn't hold up
+        # the slots from starting their scans.
+        threading.Thread(
+            target=self._set_adapter_pairable,
+            name="bt-pairable",
+            daemon=True,
+        ).start()
 
         # Create and start player slots
         for i in range(self.num_players):
@@ -631,13 +1002,51 @@ class WiimoteBridge:
         # Wait for shutdown
         self._shutdown_event.wait()
 
+    def _set_adapter_pairable(self):
+        """Set the BlueZ adapter's Pairable property over D-Bus.
+
+        One busctl set-property call, instead of a shell plus an
+        interactive bluetoothctl client. Retries briefly in case
+        bluetoothd isn't on the bus yet (but not when busctl itself is
+        missing). Never raises.
+        """
+        cmd = [
+            "busctl", "set-property", "org.bluez", BT_ADAPTER_PATH,
+            "org.bluez.Adapter1", "Pairable", "b", "true",
+        ]
+        error = ""
+        for attempt in range(BT_PAIRABLE_ATTEMPTS):
+            if attempt and self._shutdown_event.wait(BT_PAIRABLE_RETRY_DELAY):
+                return
+            try:
+                result = subprocess.run(
+                    cmd, capture_output=True, text=True, timeout=BT_PAIRABLE_TIMEOUT
+                )
+            except FileNotFoundError as exc:
+                error = str(exc)
+                break
+            except (OSError, subprocess.TimeoutExpired) as exc:
+                error = str(exc)
+                continue
+            if result.returncode == 0:
+                logger.info("Bluetooth adapter set to pairable")
+                return
+            error = result.stderr.strip()
+        logger.warning("Could not set Bluetooth adapter pairable: %s", error)
+
     def shutdown(self):
         """Gracefully stop all player slots."""
         logger.info("Shutting down Wiimote Bridge...")
+        # Stop (and disconnect) all slots concurrently, then join them
+        # against one shared deadline rather than a timeout per slot.
+        if self.slots:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(self.slots)
+            ) as pool:
+                list(pool.map(PlayerSlot.stop, self.slots))
+        deadline = time.monotonic() + 3
         for slot in self.slots:
-            slot.stop()
-        for slot in self.slots:
-            slot.join(timeout=3)
+            slot.join(timeout=max(0.0, deadline - time.monotonic()))
         logger.info("Wiimote Bridge stopped.")
         self._shutdown_event.set()
 